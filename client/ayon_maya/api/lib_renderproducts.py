@@ -5,7 +5,8 @@ This module is used in :mod:`collect_render` and :mod:`collect_vray_scene`.
 
 Note:
     To implement new renderer, just create new class inheriting from
-    :class:`ARenderProducts` and add it to :func:`RenderProducts.get()`.
+    :class:`ARenderProducts` with its `renderer` attribute set. It gets
+    registered automatically for :func:`get()`.
 
 Attributes:
     R_SINGLE_FRAME (:class:`re.Pattern`): Find single frame number.
@@ -27,6 +28,10 @@ Attributes:
         token in image prefixes.
     R_SUBSTITUTE_CAMERA_TOKEN (:class:`re.Pattern`): Find and substitute camera
         token in image prefixes.
+    R_CAMERA_ILLEGAL_CHARS (:class:`re.Pattern`): Find runs of characters
+        that are not allowed in sanitized camera names.
+    R_RENDERMAN_IMAGE_DIR_TOKEN (:class:`re.Pattern`): Find and substitute
+        scene and layer tokens in Renderman image directory.
     IMAGE_PREFIXES (dict): Mapping between renderers and their respective
         image prefix attribute names.
 
@@ -39,9 +44,9 @@ Thanks:
 import logging
 import re
 import os
-from abc import ABCMeta, abstractmethod
+from functools import lru_cache
+from abc import ABC, abstractmethod
 
-import six
 import attr
 
 from . import lib
@@ -71,6 +76,7 @@ R_SUBSTITUTE_LAYER_TOKEN = re.compile(
 )
 R_SUBSTITUTE_CAMERA_TOKEN = re.compile(r"%c|<camera>", re.IGNORECASE)
 R_SUBSTITUTE_SCENE_TOKEN = re.compile(r"%s|<scene>", re.IGNORECASE)
+R_CAMERA_ILLEGAL_CHARS = re.compile(r"[^0-9a-zA-Z_]+")
 
 # not sure about the renderman image prefix
 IMAGE_PREFIXES = {
@@ -82,16 +88,32 @@ IMAGE_PREFIXES = {
 }
 
 RENDERMAN_IMAGE_DIR = "<scene>/<layer>"
+R_RENDERMAN_IMAGE_DIR_TOKEN = re.compile(r"<(scene|layer)>", re.IGNORECASE)
+
+# lowercase only ASCII characters so string indices stay the same
+_ASCII_LOWERCASE = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+                                 "abcdefghijklmnopqrstuvwxyz")
+
+# renderer name to its `ARenderProducts` implementation, populated by
+# `ARenderProducts.__init_subclass__`
+_RENDERER_REGISTRY = {}
+
+
+@lru_cache(maxsize=256)
+def _compile_tokens(tokens):
+    # type: (tuple) -> re.Pattern
+    """Return compiled case-insensitive pattern matching any of the tokens"""
+    pattern = "({})".format("|".join(re.escape(token) for token in tokens))
+    return re.compile(pattern, re.IGNORECASE)
 
 
 def has_tokens(string, tokens):
     """Return whether any of tokens is in input string (case-insensitive)"""
-    pattern = "({})".format("|".join(re.escape(token) for token in tokens))
-    match = re.search(pattern, string, re.IGNORECASE)
+    match = _compile_tokens(tuple(tokens)).search(string)
     return bool(match)
 
 
-@attr.s
+@attr.s(slots=True)
 class LayerMetadata(object):
     """Data class for Render Layer metadata."""
     frameStart = attr.ib()
@@ -105,7 +127,8 @@ class LayerMetadata(object):
     frameStep = attr.ib(default=1)
     padding = attr.ib(default=4)
 
-    # Render Products
+    # Render Products, only filled once `ARenderProducts.products` is
+    # accessed as the products are collected lazily
     products = attr.ib(init=False, default=attr.Factory(list))
 
     # The AOV separator token. Note that not all renderers define an explicit
@@ -115,7 +138,7 @@ class LayerMetadata(object):
     aov_separator = attr.ib(default="_")
 
 
-@attr.s
+@attr.s(slots=True)
 class RenderProduct(object):
     """Describes an image or other file-like artifact produced by a render.
 
@@ -152,8 +175,7 @@ def get(layer, render_instance=None):
     Raises:
         :exc:`UnsupportedRendererException`: If requested renderer
             is not supported. It needs to be implemented by extending
-            :class:`ARenderProducts` and added to this methods ``if``
-            statement.
+            :class:`ARenderProducts`.
 
     """
 
@@ -168,13 +190,7 @@ def get(layer, render_instance=None):
         layer=layer
     )
 
-    renderer = {
-        "arnold": RenderProductsArnold,
-        "vray": RenderProductsVray,
-        "redshift": RenderProductsRedshift,
-        "renderman": RenderProductsRenderman,
-        "mayahardware2": RenderProductsMayaHardware
-    }.get(renderer_name.lower(), None)
+    renderer = _RENDERER_REGISTRY.get(renderer_name.lower())
     if renderer is None:
         raise UnsupportedRendererException(
             "Unsupported renderer: {}".format(renderer_name)
@@ -183,8 +199,7 @@ def get(layer, render_instance=None):
     return renderer(layer, render_instance)
 
 
-@six.add_metaclass(ABCMeta)
-class ARenderProducts:
+class ARenderProducts(ABC):
     """Abstract class with common code for all renderers.
 
     Attributes:
@@ -194,15 +209,41 @@ class ARenderProducts:
 
     renderer = None
 
+    def __init_subclass__(cls, **kwargs):
+        """Register the subclass for its renderer to be found by `get()`."""
+        super(ARenderProducts, cls).__init_subclass__(**kwargs)
+        if cls.renderer:
+            _RENDERER_REGISTRY[cls.renderer] = cls
+
     def __init__(self, layer, render_instance):
         """Constructor."""
         self.layer = layer
         self.render_instance = render_instance
+        self._renderable_cameras = None
+        self._sanitized_cameras = None
+        self._attr_cache = {}
+        self._products = None
         self.multipart = self.get_multipart()
 
         # Initialize
         self.layer_data = self._get_layer_data()
-        self.layer_data.products = self.get_render_products()
+
+    @property
+    def products(self):
+        # type: () -> list
+        """Render products of the layer.
+
+        The render products are collected on first access and stored on
+        the layer data too.
+
+        Returns:
+            list: List of RenderProduct
+
+        """
+        if self._products is None:
+            self._products = self.get_render_products()
+            self.layer_data.products = self._products
+        return self._products
 
     def get_multipart(self):
         raise NotImplementedError(
@@ -249,7 +290,7 @@ class ARenderProducts:
             test_camera_01
 
         """
-        return re.sub('[^0-9a-zA-Z_]+', '_', camera)
+        return R_CAMERA_ILLEGAL_CHARS.sub("_", camera)
 
     def get_renderer_prefix(self):
         # type: () -> str
@@ -307,6 +348,9 @@ class ARenderProducts:
             Or as two arguments:
                 _get_attr("node", "attr")
 
+        The values are cached per instance as the layer is fixed and the
+        scene is not expected to change while collecting render products.
+
         Returns:
             Value of the attribute inside the layer this instance is set to.
 
@@ -315,9 +359,59 @@ class ARenderProducts:
         if attribute is None:
             plug = node_attr
         else:
-            plug = "{}.{}".format(node_attr, attribute)
+            plug = f"{node_attr}.{attribute}"
+
+        key = (plug, as_string)
+        try:
+            return self._attr_cache[key]
+        except KeyError:
+            pass
+
+        value = lib.get_attr_in_layer(
+            plug, layer=self.layer, as_string=as_string)
+        self._attr_cache[key] = value
+        return value
+
+    def _get_attrs(self, node, attributes, as_string=True):
+        """Return the values of multiple attributes of a node in the layer.
 
-        return lib.get_attr_in_layer(plug, layer=self.layer, as_string=as_string)
+        Args:
+            node (str): Node name.
+            attributes (list): Attribute names to query.
+            as_string (bool): Whether to convert the values to string.
+
+        Returns:
+            dict: Attribute name to its value inside the layer this instance
+                is set to.
+
+        """
+        return {
+            attribute: self._get_attr(node, attribute, as_string=as_string)
+            for attribute in attributes
+        }
+
+    def _get_aov_nodes(self, node_type):
+        """Return AOV nodes of the given type(s) in the scene.
+
+        Referenced AOV nodes are excluded unless the render instance
+        has `useReferencedAovs` enabled.
+
+        Args:
+            node_type (str or list): AOV node type(s).
+
+        Returns:
+            list: AOV node names in scene order.
+
+        """
+        aovs = cmds.ls(type=node_type) or []
+        use_ref_aovs = self.render_instance.data.get(
+            "useReferencedAovs", False) or False
+        if not use_ref_aovs:
+            ref_aovs = frozenset(
+                cmds.ls(type=node_type, referencedNodes=True) or []
+            )
+            aovs = [aov for aov in aovs if aov not in ref_aovs]
+        return aovs
 
     @staticmethod
     def extract_separator(file_prefix):
@@ -337,21 +431,23 @@ class ARenderProducts:
         Returns:
             str or None: prefix character if it can be extracted.
         """
-        layer_tokens = ["<renderlayer>", "<layer>"]
-        aov_tokens = ["<aov>", "<renderpass>"]
-
-        def match_last(tokens, text):
-            """regex match the last occurrence from a list of tokens"""
-            pattern = "(?:.*)({})".format("|".join(tokens))
-            return re.search(pattern, text, re.IGNORECASE)
-
-        layer_match = match_last(layer_tokens, file_prefix)
-        aov_match = match_last(aov_tokens, file_prefix)
+        prefix_lower = file_prefix.translate(_ASCII_LOWERCASE)
+
+        def find_last(tokens):
+            """Return (start, end) of the last occurrence of any token"""
+            span = None
+            for token in tokens:
+                start = prefix_lower.rfind(token)
+                if start != -1 and (span is None or start > span[0]):
+                    span = (start, start + len(token))
+            return span
+
+        layer_span = find_last(("<renderlayer>", "<layer>"))
+        aov_span = find_last(("<aov>", "<renderpass>"))
         separator = None
-        if layer_match and aov_match:
-            matches = sorted((layer_match, aov_match),
-                             key=lambda match: match.end(1))
-            separator = file_prefix[matches[0].end(1):matches[1].start(1)]
+        if layer_span and aov_span:
+            spans = sorted((layer_span, aov_span), key=lambda span: span[1])
+            separator = file_prefix[spans[0][1]:spans[1][0]]
         return separator
 
     def _get_layer_data(self):
@@ -413,35 +509,77 @@ class ARenderProducts:
         expected_files = []
         cameras = force_cameras or layer_data.cameras
         ext = force_ext or layer_data.defaultExt
-        for cam in cameras:
-            file_prefix = layer_data.filePrefix
-            mappings = (
-                (R_SUBSTITUTE_SCENE_TOKEN, layer_data.sceneName),
-                (R_SUBSTITUTE_LAYER_TOKEN, layer_data.layerName),
-                (R_SUBSTITUTE_CAMERA_TOKEN, self.sanitize_camera_name(cam)),
-                # this is required to remove unfilled aov token, for example
-                # in Redshift
-                (R_REMOVE_AOV_TOKEN, "") if not force_aov_name \
-                else (R_SUBSTITUTE_AOV_TOKEN, force_aov_name),
-
-                (R_CLEAN_FRAME_TOKEN, ""),
-                (R_CLEAN_EXT_TOKEN, ""),
-            )
+        frames = range(
+            int(layer_data.frameStart),
+            int(layer_data.frameEnd) + 1,
+            int(layer_data.frameStep),
+        )
+
+        # skip the token substitution for prefixes without any tokens
+        file_prefix = layer_data.filePrefix
+        has_prefix_tokens = "<" in file_prefix or "%" in file_prefix
+        has_camera_token = False
+        if has_prefix_tokens:
+            file_prefix = re.sub(
+                R_SUBSTITUTE_SCENE_TOKEN, layer_data.sceneName, file_prefix)
+            file_prefix = re.sub(
+                R_SUBSTITUTE_LAYER_TOKEN, layer_data.layerName, file_prefix)
+            has_camera_token = bool(
+                R_SUBSTITUTE_CAMERA_TOKEN.search(file_prefix))
+            if not has_camera_token:
+                # resolve the remaining tokens only once for all cameras
+                file_prefix = self._resolve_aov_and_clean_tokens(
+                    file_prefix, force_aov_name)
 
-            for regex, value in mappings:
-                file_prefix = re.sub(regex, value, file_prefix)
-
-            for frame in range(
-                    int(layer_data.frameStart),
-                    int(layer_data.frameEnd) + 1,
-                    int(layer_data.frameStep),
-            ):
-                frame_str = str(frame).rjust(layer_data.padding, "0")
-                expected_files.append(
-                    "{}.{}.{}".format(file_prefix, frame_str, ext)
+        for cam in cameras:
+            cam_file_prefix = file_prefix
+            if has_camera_token:
+                # the camera token has to be resolved before the AOV token
+                # since the AOV token removal relies on the separators
+                # around it
+                cam_file_prefix = re.sub(
+                    R_SUBSTITUTE_CAMERA_TOKEN,
+                    self.sanitize_camera_name(cam),
+                    file_prefix
                 )
+                cam_file_prefix = self._resolve_aov_and_clean_tokens(
+                    cam_file_prefix, force_aov_name)
+
+            # precompute the filename template with the frame number being
+            # the only field left to format, braces in the prefix and
+            # extension are escaped to be kept literally
+            template = "{}.{{:0>{}}}.{}".format(
+                cam_file_prefix.replace("{", "{{").replace("}", "}}"),
+                layer_data.padding,
+                str(ext).replace("{", "{{").replace("}", "}}")
+            )
+            expected_files.extend(template.format(frame) for frame in frames)
         return expected_files
 
+    @staticmethod
+    def _resolve_aov_and_clean_tokens(file_prefix, force_aov_name=None):
+        """Resolve AOV token and remove unfilled frame and extension tokens.
+
+        Args:
+            file_prefix (str): File prefix with scene, layer and camera
+                tokens already resolved.
+            force_aov_name (str, Optional): AOV name to substitute the AOV
+                token with. When not set the AOV token is removed.
+
+        Returns:
+            str: Resolved file prefix.
+
+        """
+        if force_aov_name:
+            file_prefix = re.sub(
+                R_SUBSTITUTE_AOV_TOKEN, force_aov_name, file_prefix)
+        else:
+            # this is required to remove unfilled aov token, for example
+            # in Redshift
+            file_prefix = re.sub(R_REMOVE_AOV_TOKEN, "", file_prefix)
+        file_prefix = re.sub(R_CLEAN_FRAME_TOKEN, "", file_prefix)
+        return re.sub(R_CLEAN_EXT_TOKEN, "", file_prefix)
+
     def get_files(self, product):
         # type: (RenderProduct) -> list
         """Return list of expected files.
@@ -470,13 +608,22 @@ class ARenderProducts:
         # type: () -> list
         """Get all renderable camera transforms.
 
+        The result is cached on the instance as the renderable cameras are
+        requested multiple times while collecting the render products.
+
+        All render products are generated per camera, so renderers return
+        no products right away when there are no renderable cameras,
+        without querying image formats, colorspaces or AOVs.
+
         Returns:
             list: list of renderable cameras.
 
         """
+        if self._renderable_cameras is not None:
+            return self._renderable_cameras
 
         renderable_cameras = [
-            cam for cam in cmds.ls(cameras=True)
+            cam for cam in cmds.ls(cameras=True, long=True)
             if self._get_attr(cam, "renderable")
         ]
 
@@ -485,12 +632,29 @@ class ARenderProducts:
         # at least that unique path. This could include a parent
         # name too when two cameras have the same name but are
         # in a different hierarchy, e.g. "group1|cam" and "group2|cam"
-        def get_name(camera):
-            return cmds.ls(cmds.listRelatives(camera,
-                                              parent=True,
-                                              fullPath=True))[0]
+        # The parent transforms are taken from the full path of the camera
+        # shapes so the shortest unique paths are queried in one go.
+        parents = [cam.rsplit("|", 1)[0] for cam in renderable_cameras]
+        self._renderable_cameras = cmds.ls(parents) if parents else []
+        return self._renderable_cameras
+
+    def get_sanitized_cameras(self):
+        # type: () -> list
+        """Get sanitized names of all renderable cameras.
+
+        The result is cached on the instance, a new instance should be
+        created for each render layer.
+
+        Returns:
+            list: list of sanitized renderable camera names.
 
-        return [get_name(cam) for cam in renderable_cameras]
+        """
+        if self._sanitized_cameras is None:
+            self._sanitized_cameras = [
+                self.sanitize_camera_name(camera)
+                for camera in self.get_renderable_cameras()
+            ]
+        return self._sanitized_cameras
 
 
 class RenderProductsArnold(ARenderProducts):
@@ -527,6 +691,12 @@ class RenderProductsArnold(ARenderProducts):
         "maya": "",
     }
 
+    def __init__(self, layer, render_instance):
+        # Resolved colorspace per driver color management mode. The
+        # preferences and OCIO config views do not change while collecting.
+        self._colorspaces = {}
+        super(RenderProductsArnold, self).__init__(layer, render_instance)
+
     def get_renderer_prefix(self):
 
         prefix = super(RenderProductsArnold, self).get_renderer_prefix()
@@ -553,22 +723,41 @@ class RenderProductsArnold(ARenderProducts):
         """Return all render products for the AOV"""
 
         products = []
-        aov_name = self._get_attr(aov, "name")
+        # Query the AOV attributes once as they are the same for all drivers
+        aov_attrs = self._get_attrs(
+            aov, ["name", "globalAov", "lightGroups", "lightGroupsList"]
+        )
+        aov_name = aov_attrs["name"]
         ai_drivers = cmds.listConnections("{}.outputs".format(aov),
                                           source=True,
                                           destination=False,
                                           type="aiAOVDriver") or []
         if not cameras:
-            cameras = [
-                self.sanitize_camera_name(
-                    self.get_renderable_cameras()[0]
-                )
+            cameras = self.get_sanitized_cameras()[:1]
+
+        # If aov RGBA is selected, arnold will translate it to `beauty`
+        name = aov_name
+        if name == "RGBA":
+            name = "beauty"
+
+        # Support Arnold light groups for AOVs
+        # Global AOV: When disabled the main layer is
+        #             not written: `{pass}`
+        # All Light Groups: When enabled, a `{pass}_lgroups` file is
+        #                   written and is always merged into a
+        #                   single file
+        # Light Groups List: When set, a product per light
+        #                    group is written
+        #                    e.g. {pass}_front, {pass}_rim
+        # The resulting product names are the same for all drivers.
+        light_group_names = []
+        if not aov_attrs["lightGroups"] and aov_attrs["lightGroupsList"]:
+            light_group_names = [
+                f"{name}_{light_group}"
+                for light_group in aov_attrs["lightGroupsList"].strip().split()
             ]
 
         for ai_driver in ai_drivers:
-            colorspace = self._get_colorspace(
-                ai_driver + ".colorManagement"
-            )
             # todo: check aiAOVDriver.prefix as it could have
             #       a custom path prefix set for this driver
 
@@ -580,33 +769,20 @@ class RenderProductsArnold(ARenderProducts):
                             "skipping...", ai_driver)
                 continue
 
+            colorspace = self._get_colorspace(
+                ai_driver + ".colorManagement"
+            )
             ai_translator = self._get_attr(ai_driver, "aiTranslator")
-            try:
-                ext = self.aiDriverExtension[ai_translator]
-            except KeyError:
+            ext = self.aiDriverExtension.get(ai_translator)
+            if ext is None:
                 raise AOVError(
                     "Unrecognized arnold driver format "
                     "for AOV - {}".format(aov_name)
                 )
 
-            # If aov RGBA is selected, arnold will translate it to `beauty`
-            name = aov_name
-            if name == "RGBA":
-                name = "beauty"
-
-            # Support Arnold light groups for AOVs
-            # Global AOV: When disabled the main layer is
-            #             not written: `{pass}`
-            # All Light Groups: When enabled, a `{pass}_lgroups` file is
-            #                   written and is always merged into a
-            #                   single file
-            # Light Groups List: When set, a product per light
-            #                    group is written
-            #                    e.g. {pass}_front, {pass}_rim
-            global_aov = self._get_attr(aov, "globalAov")
-            if global_aov:
-                for camera in cameras:
-                    product = RenderProduct(
+            if aov_attrs["globalAov"]:
+                products.extend(
+                    RenderProduct(
                         productName=name,
                         ext=ext,
                         aov=aov_name,
@@ -614,15 +790,14 @@ class RenderProductsArnold(ARenderProducts):
                         multipart=self.multipart,
                         camera=camera,
                         colorspace=colorspace
-                    )
-                    products.append(product)
+                    ) for camera in cameras
+                )
 
-            all_light_groups = self._get_attr(aov, "lightGroups")
-            if all_light_groups:
+            if aov_attrs["lightGroups"]:
                 # All light groups is enabled. A single multipart
                 # Render Product
-                for camera in cameras:
-                    product = RenderProduct(
+                products.extend(
+                    RenderProduct(
                         productName=name + "_lgroups",
                         ext=ext,
                         aov=aov_name,
@@ -631,26 +806,22 @@ class RenderProductsArnold(ARenderProducts):
                         multipart=True,
                         camera=camera,
                         colorspace=colorspace
-                    )
-                    products.append(product)
-            else:
-                value = self._get_attr(aov, "lightGroupsList")
-                if not value:
-                    continue
-                selected_light_groups = value.strip().split()
-                for light_group in selected_light_groups:
-                    # Render Product per selected light group
-                    aov_light_group_name = "{}_{}".format(name, light_group)
-                    for camera in cameras:
-                        product = RenderProduct(
-                            productName=aov_light_group_name,
-                            aov=aov_name,
-                            driver=ai_driver,
-                            ext=ext,
-                            camera=camera,
-                            colorspace=colorspace
-                        )
-                        products.append(product)
+                    ) for camera in cameras
+                )
+
+            # Render Product per selected light group
+            products.extend(
+                RenderProduct(
+                    productName=aov_light_group_name,
+                    aov=aov_name,
+                    driver=ai_driver,
+                    ext=ext,
+                    camera=camera,
+                    colorspace=colorspace
+                )
+                for aov_light_group_name in light_group_names
+                for camera in cameras
+            )
 
         return products
 
@@ -669,13 +840,19 @@ class RenderProductsArnold(ARenderProducts):
             preferences = lib.get_color_management_preferences()
             return preferences["rendering_space"]
 
+        mode = self._get_attr(attribute)
+        if mode in self._colorspaces:
+            return self._colorspaces[mode]
+
         resolved_values = {
             "Raw": _raw,
             "Use View Transform": _view_transform,
             # Default. Same as Maya Preferences.
             "Use Output Transform": lib.get_color_management_output_transform
         }
-        return resolved_values[self._get_attr(attribute)]()
+        colorspace = resolved_values[mode]()
+        self._colorspaces[mode] = colorspace
+        return colorspace
 
     def get_render_products(self):
         """Get all AOVs.
@@ -699,10 +876,9 @@ class RenderProductsArnold(ARenderProducts):
         # check if camera token is in prefix. If so, and we have list of
         # renderable cameras, generate render product for each and every
         # of them.
-        cameras = [
-            self.sanitize_camera_name(c)
-            for c in self.get_renderable_cameras()
-        ]
+        cameras = self.get_sanitized_cameras()
+        if not cameras:
+            return []
 
         default_ext = self._get_attr("defaultRenderGlobals.imfPluginKey")
         colorspace = self._get_colorspace(
@@ -739,14 +915,7 @@ class RenderProductsArnold(ARenderProducts):
 
         # AOVs are set to be rendered separately. We should expect
         # <RenderPass> token in path.
-        # handle aovs from references
-        use_ref_aovs = self.render_instance.data.get(
-            "useReferencedAovs", False) or False
-
-        aovs = cmds.ls(type="aiAOV")
-        if not use_ref_aovs:
-            ref_aovs = cmds.ls(type="aiAOV", referencedNodes=True)
-            aovs = list(set(aovs) - set(ref_aovs))
+        aovs = self._get_aov_nodes("aiAOV")
 
         products = []
 
@@ -850,10 +1019,9 @@ class RenderProductsVray(ARenderProducts):
             # anyway.
             return []
 
-        cameras = [
-            self.sanitize_camera_name(c)
-            for c in self.get_renderable_cameras()
-        ]
+        cameras = self.get_sanitized_cameras()
+        if not cameras:
+            return []
 
         image_format_str = self._get_attr("vraySettings.imageFormatStr")
         default_ext = image_format_str
@@ -866,45 +1034,35 @@ class RenderProductsVray(ARenderProducts):
         # add beauty as default when not disabled
         dont_save_rgb = self._get_attr("vraySettings.dontSaveRgbChannel")
         if not dont_save_rgb:
-            for camera in cameras:
-                products.append(
-                    RenderProduct(
-                        productName="",
-                        ext=default_ext,
-                        camera=camera,
-                        colorspace=colorspace,
-                        multipart=self.multipart
-                    )
-                )
+            products.extend(
+                RenderProduct(
+                    productName="",
+                    ext=default_ext,
+                    camera=camera,
+                    colorspace=colorspace,
+                    multipart=self.multipart
+                ) for camera in cameras
+            )
 
         # separate alpha file
         separate_alpha = self._get_attr("vraySettings.separateAlpha")
         if separate_alpha:
-            for camera in cameras:
-                products.append(
-                    RenderProduct(
-                        productName="Alpha",
-                        ext=default_ext,
-                        camera=camera,
-                        colorspace=colorspace,
-                        multipart=self.multipart
-                    )
-                )
+            products.extend(
+                RenderProduct(
+                    productName="Alpha",
+                    ext=default_ext,
+                    camera=camera,
+                    colorspace=colorspace,
+                    multipart=self.multipart
+                ) for camera in cameras
+            )
         if self.multipart:
             # AOVs are merged in m-channel file, only main layer is rendered
             return products
 
-        # handle aovs from references
-        use_ref_aovs = self.render_instance.data.get(
-            "useReferencedAovs", False) or False
-
-        # this will have list of all aovs no matter if they are coming from
-        # reference or not.
-        aov_types = ["VRayRenderElement", "VRayRenderElementSet"]
-        aovs = cmds.ls(type=aov_types)
-        if not use_ref_aovs:
-            ref_aovs = cmds.ls(type=aov_types, referencedNodes=True) or []
-            aovs = list(set(aovs) - set(ref_aovs))
+        aovs = self._get_aov_nodes(
+            ["VRayRenderElement", "VRayRenderElementSet"]
+        )
 
         for aov in aovs:
             enabled = self._get_attr(aov, "enabled")
@@ -917,32 +1075,34 @@ class RenderProductsVray(ARenderProducts):
                 # instead seems to output multiple Render Products,
                 # specifically "Self_Illumination" and "Environment"
                 product_names = ["Self_Illumination", "Environment"]
-                for camera in cameras:
-                    for name in product_names:
-                        product = RenderProduct(productName=name,
-                                                ext=default_ext,
-                                                aov=aov,
-                                                camera=camera,
-                                                colorspace=colorspace)
-                        products.append(product)
+                products.extend(
+                    RenderProduct(productName=name,
+                                  ext=default_ext,
+                                  aov=aov,
+                                  camera=camera,
+                                  colorspace=colorspace)
+                    for camera in cameras
+                    for name in product_names
+                )
                 # Continue as we've processed this special case AOV
                 continue
 
             aov_name = self._get_vray_aov_name(aov)
-            for camera in cameras:
-                product = RenderProduct(
+            products.extend(
+                RenderProduct(
                     productName=aov_name,
                     ext=default_ext,
                     aov=aov,
                     camera=camera,
                     colorspace=colorspace
-                )
-                products.append(product)
+                ) for camera in cameras
+            )
 
         return products
 
-    def _get_vray_aov_attr(self, node, prefix):
-        """Get value for attribute that starts with key in name
+    @staticmethod
+    def _get_vray_aov_attrs(node, prefixes):
+        """Get attributes that start with the keys in name
 
         V-Ray AOVs have attribute names that include the type
         of AOV in the attribute name, for example:
@@ -953,24 +1113,35 @@ class RenderProductsVray(ARenderProducts):
 
         To simplify querying the "vray_filename" or "vray_name"
         attributes we just find the first attribute that has
-        that particular "{prefix}_" in the attribute name.
+        that particular "{prefix}_" in the attribute name. The
+        attributes of the node are listed once and filtered by
+        prefix in Python instead of Maya's wildcard matching.
 
         Args:
             node (str): AOV node name
-            prefix (str): Prefix of the attribute name.
+            prefixes (list): Prefixes of the attribute names.
 
         Returns:
-            Value of the attribute if it exists, else None
+            dict: Attribute name per prefix if it exists, else None
 
         """
-        attrs = cmds.listAttr(node, string="{}_*".format(prefix))
-        if not attrs:
-            return None
+        attrs = cmds.listAttr(node) or []
 
-        assert len(attrs) == 1, "Found more than one attribute: %s" % attrs
-        attr = attrs[0]
+        prefix_attrs = {}
+        for prefix in prefixes:
+            attr_prefix = "{}_".format(prefix)
+            matches = [
+                attr for attr in attrs if attr.startswith(attr_prefix)
+            ]
+            if not matches:
+                prefix_attrs[prefix] = None
+                continue
+
+            assert len(matches) == 1, (
+                "Found more than one attribute: %s" % matches)
+            prefix_attrs[prefix] = matches[0]
 
-        return self._get_attr(node, attr)
+        return prefix_attrs
 
     def _get_vray_aov_name(self, node):
         """Get AOVs name from Vray.
@@ -983,11 +1154,24 @@ class RenderProductsVray(ARenderProducts):
 
         """
 
-        vray_explicit_name = self._get_vray_aov_attr(node,
-                                                     "vray_explicit_name")
-        vray_filename = self._get_vray_aov_attr(node, "vray_filename")
-        vray_name = self._get_vray_aov_attr(node, "vray_name")
-        final_name = vray_explicit_name or vray_filename or vray_name or None
+        prefix_attrs = self._get_vray_aov_attrs(
+            node, ["vray_explicit_name", "vray_filename", "vray_name"]
+        )
+
+        def _get_value(prefix):
+            """Return value of the attribute for prefix if it exists"""
+            attr = prefix_attrs[prefix]
+            if attr:
+                return self._get_attr(node, attr)
+
+        # Only query the fallback names when the preceding one is not set
+        vray_explicit_name = _get_value("vray_explicit_name")
+        final_name = (
+            vray_explicit_name
+            or _get_value("vray_filename")
+            or _get_value("vray_name")
+            or None
+        )
 
         class_type = self._get_attr(node, "vrayClassType")
         if not vray_explicit_name:
@@ -997,7 +1181,7 @@ class RenderProductsVray(ARenderProducts):
             # so we sanitize using `sanitize_camera_name`
             def _get_source_name(node, attr):
                 """Return sanitized name of input connection to attribute"""
-                plug = "{}.{}".format(node, attr)
+                plug = f"{node}.{attr}"
                 connections = cmds.listConnections(plug,
                                                    source=True,
                                                    destination=False)
@@ -1054,6 +1238,10 @@ class RenderProductsRedshift(ARenderProducts):
     renderer = "redshift"
     unmerged_aovs = {"Cryptomatte"}
 
+    def __init__(self, layer, render_instance):
+        self._light_groups = None
+        super(RenderProductsRedshift, self).__init__(layer, render_instance)
+
     def get_files(self, product):
         # When outputting AOVs we need to replace Redshift specific AOV tokens
         # with Maya render tokens for generating file sequences. We validate to
@@ -1116,23 +1304,14 @@ class RenderProductsRedshift(ARenderProducts):
             # anyway.
             return []
 
-        cameras = [
-            self.sanitize_camera_name(c)
-            for c in self.get_renderable_cameras()
-        ]
+        cameras = self.get_sanitized_cameras()
+        if not cameras:
+            return []
 
         # Get Redshift Extension from image format
         image_format = self._get_attr("redshiftOptions.imageFormat")  # integer
         ext = mel.eval("redshiftGetImageExtension(%i)" % image_format)
 
-        use_ref_aovs = self.render_instance.data.get(
-            "useReferencedAovs", False) or False
-
-        aovs = cmds.ls(type="RedshiftAOV")
-        if not use_ref_aovs:
-            ref_aovs = cmds.ls(type="RedshiftAOV", referencedNodes=True)
-            aovs = list(set(aovs) - set(ref_aovs))
-
         products = []
         global_aov_enabled = bool(
             self._get_attr("redshiftOptions.aovGlobalEnableMode", as_string=False)
@@ -1149,6 +1328,8 @@ class RenderProductsRedshift(ARenderProducts):
                                               colorspace=colorspace))
             return products
 
+        # Only list the AOV nodes when AOVs are globally enabled
+        aovs = self._get_aov_nodes("RedshiftAOV")
         light_groups_enabled = False
         has_beauty_aov = False
 
@@ -1185,19 +1366,18 @@ class RenderProductsRedshift(ARenderProducts):
                         selected_light_groups = value.strip().split()
                         light_groups = selected_light_groups
 
-                for light_group in light_groups:
-                    aov_light_group_name = "{}_{}".format(aov_name,
-                                                          light_group)
-                    for camera in cameras:
-                        product = RenderProduct(
-                            productName=aov_light_group_name,
-                            aov=aov_name,
-                            ext=ext,
-                            multipart=False,
-                            camera=camera,
-                            driver=aov,
-                            colorspace=colorspace)
-                        products.append(product)
+                products.extend(
+                    RenderProduct(
+                        productName=f"{aov_name}_{light_group}",
+                        aov=aov_name,
+                        ext=ext,
+                        multipart=False,
+                        camera=camera,
+                        driver=aov,
+                        colorspace=colorspace)
+                    for light_group in light_groups
+                    for camera in cameras
+                )
 
             if light_groups:
                 light_groups_enabled = True
@@ -1205,15 +1385,16 @@ class RenderProductsRedshift(ARenderProducts):
             # Redshift AOV Light Select always renders the global AOV
             # even when light groups are present so we don't need to
             # exclude it when light groups are active
-            for camera in cameras:
-                product = RenderProduct(productName=aov_name,
-                                        aov=aov_name,
-                                        ext=ext,
-                                        multipart=False,
-                                        camera=camera,
-                                        driver=aov,
-                                        colorspace=colorspace)
-                products.append(product)
+            products.extend(
+                RenderProduct(productName=aov_name,
+                              aov=aov_name,
+                              ext=ext,
+                              multipart=False,
+                              camera=camera,
+                              driver=aov,
+                              colorspace=colorspace)
+                for camera in cameras
+            )
 
         # When a Beauty AOV is added manually, it will be rendered as
         # 'Beauty_other' in file name and "standard" beauty will have
@@ -1233,9 +1414,11 @@ class RenderProductsRedshift(ARenderProducts):
 
         return products
 
-    @staticmethod
-    def _get_redshift_light_groups():
-        return sorted(mel.eval("redshiftAllAovLightGroups"))
+    def _get_redshift_light_groups(self):
+        # All light groups in the scene are the same for every AOV
+        if self._light_groups is None:
+            self._light_groups = sorted(mel.eval("redshiftAllAovLightGroups"))
+        return self._light_groups
 
 
 class RenderProductsRenderman(ARenderProducts):
@@ -1248,6 +1431,24 @@ class RenderProductsRenderman(ARenderProducts):
     renderer = "renderman"
     unmerged_aovs = {"PxrCryptomatte"}
 
+    # NOTE: This is guessing extensions from renderman display types.
+    #       Some of them are just framebuffers, d_texture format can be
+    #       set in display setting. We set those now to None, but it
+    #       should be handled more gracefully.
+    display_types = {
+        "d_deepexr": "exr",
+        "d_it": None,
+        "d_null": None,
+        "d_openexr": "exr",
+        "d_png": "png",
+        "d_pointcloud": "ptc",
+        "d_targa": "tga",
+        "d_texture": None,
+        "d_tiff": "tif"
+    }
+    # Display types supporting multipart output
+    multipart_display_types = frozenset({"d_openexr", "d_deepexr", "d_tiff"})
+
     def get_multipart(self):
         # Implemented as display specific in "get_render_products".
         return False
@@ -1261,35 +1462,24 @@ class RenderProductsRenderman(ARenderProducts):
         """
         from rfm2.api.displays import get_displays  # noqa
 
-        colorspace = lib.get_color_management_output_transform()
-
-        cameras = [
-            self.sanitize_camera_name(c)
-            for c in self.get_renderable_cameras()
-        ]
-
+        cameras = self.get_sanitized_cameras()
         if not cameras:
-            cameras = [
-                self.sanitize_camera_name(
-                    self.get_renderable_cameras()[0])
-            ]
+            return []
+
+        colorspace = lib.get_color_management_output_transform()
         products = []
 
-        # NOTE: This is guessing extensions from renderman display types.
-        #       Some of them are just framebuffers, d_texture format can be
-        #       set in display setting. We set those now to None, but it
-        #       should be handled more gracefully.
-        display_types = {
-            "d_deepexr": "exr",
-            "d_it": None,
-            "d_null": None,
-            "d_openexr": "exr",
-            "d_png": "png",
-            "d_pointcloud": "ptc",
-            "d_targa": "tga",
-            "d_texture": None,
-            "d_tiff": "tif"
-        }
+        # Cryptomatte is the same for all displays so query it only once
+        has_cryptomatte = cmds.ls(type=self.unmerged_aovs)
+        matte_enabled = False
+        if has_cryptomatte:
+            for cryptomatte in has_cryptomatte:
+                cryptomatte_aov = cryptomatte
+                matte_name = "cryptomatte"
+                rman_globals = cmds.listConnections(cryptomatte +
+                                                    ".message")
+                if rman_globals:
+                    matte_enabled = True
 
         displays = get_displays(override_dst="render")["displays"]
         for name, display in displays.items():
@@ -1299,32 +1489,21 @@ class RenderProductsRenderman(ARenderProducts):
 
             # Skip display types not producing any file output.
             # Is there a better way to do it?
-            if not display_types.get(display["driverNode"]["type"]):
+            display_type = display["driverNode"]["type"]
+            extensions = self.display_types.get(display_type)
+            if not extensions:
                 continue
-
-            has_cryptomatte = cmds.ls(type=self.unmerged_aovs)
-            matte_enabled = False
-            if has_cryptomatte:
-                for cryptomatte in has_cryptomatte:
-                    cryptomatte_aov = cryptomatte
-                    matte_name = "cryptomatte"
-                    rman_globals = cmds.listConnections(cryptomatte +
-                                                        ".message")
-                    if rman_globals:
-                        matte_enabled = True
+            multipart = display_type in self.multipart_display_types
 
             aov_name = name
             if aov_name == "rmanDefaultDisplay":
                 aov_name = "beauty"
 
-            extensions = display_types.get(
-                display["driverNode"]["type"], "exr")
-
             for camera in cameras:
                 # Create render product and set it as multipart only on
                 # display types supporting it. In all other cases, Renderman
                 # will create separate output per channel.
-                if display["driverNode"]["type"] in ["d_openexr", "d_deepexr", "d_tiff"]:  # noqa
+                if multipart:
                     product = RenderProduct(
                         productName=aov_name,
                         ext=extensions,
@@ -1373,15 +1552,15 @@ class RenderProductsRenderman(ARenderProducts):
         files = super(RenderProductsRenderman, self).get_files(product)
 
         layer_data = self.layer_data
-        new_files = []
-
-        resolved_image_dir = re.sub("<scene>", layer_data.sceneName, RENDERMAN_IMAGE_DIR, flags=re.IGNORECASE)  # noqa: E501
-        resolved_image_dir = re.sub("<layer>", layer_data.layerName, resolved_image_dir, flags=re.IGNORECASE)  # noqa: E501
-        for file in files:
-            new_file = "{}/{}".format(resolved_image_dir, file)
-            new_files.append(new_file)
-
-        return new_files
+        values = {
+            "scene": layer_data.sceneName,
+            "layer": layer_data.layerName
+        }
+        resolved_image_dir = R_RENDERMAN_IMAGE_DIR_TOKEN.sub(
+            lambda match: values[match.group(1).lower()],
+            RENDERMAN_IMAGE_DIR
+        )
+        return [f"{resolved_image_dir}/{file}" for file in files]
 
 
 class RenderProductsMayaHardware(ARenderProducts):
@@ -1394,60 +1573,53 @@ class RenderProductsMayaHardware(ARenderProducts):
         {"label": "PNG", "index": 32, "extension": "png"},
         {"label": "EXR(exr)", "index": 40, "extension": "exr"}
     ]
+    _extensions_by_index = {
+        extension["index"]: extension["extension"]
+        for extension in extensions
+    }
+    _extensions_by_label = {
+        extension["label"]: extension["extension"]
+        for extension in extensions
+    }
 
     def get_multipart(self):
         # MayaHardware does not support multipart EXRs.
         return False
 
     def _get_extension(self, value):
-        result = None
         if isinstance(value, int):
-            extensions = {
-                extension["index"]: extension["extension"]
-                for extension in self.extensions
-            }
-            try:
-                result = extensions[value]
-            except KeyError:
-                raise NotImplementedError(
-                    "Could not find extension for {}".format(value)
-                )
-
-        if isinstance(value, six.string_types):
-            extensions = {
-                extension["label"]: extension["extension"]
-                for extension in self.extensions
-            }
-            try:
-                result = extensions[value]
-            except KeyError:
-                raise NotImplementedError(
-                    "Could not find extension for {}".format(value)
-                )
+            extensions = self._extensions_by_index
+        else:
+            extensions = self._extensions_by_label
 
-        if not result:
+        try:
+            return extensions[value]
+        except (KeyError, TypeError):
             raise NotImplementedError(
                 "Could not find extension for {}".format(value)
             )
 
-        return result
-
     def get_render_products(self):
         """Get all AOVs.
         See Also:
             :func:`ARenderProducts.get_render_products()`
         """
+        cameras = self.get_renderable_cameras()
+        if not cameras:
+            return []
+
         ext = self._get_extension(
             self._get_attr("defaultRenderGlobals.imageFormat")
         )
+        colorspace = lib.get_color_management_output_transform()
 
         products = []
-        for cam in self.get_renderable_cameras():
+        for cam in cameras:
             product = RenderProduct(
                 productName="beauty",
                 ext=ext,
                 camera=cam,
-                colorspace=lib.get_color_management_output_transform()
+                colorspace=colorspace
             )
             products.append(product)
 
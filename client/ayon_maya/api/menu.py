@@ -13,9 +13,8 @@ from ayon_core.pipeline import (
     get_current_task_name,
     registered_host
 )
-from ayon_core.pipeline.workfile import BuildWorkfile
 from ayon_core.tools.utils import host_tools
-from ayon_maya.api import lib, lib_rendersettings
+from ayon_maya.api import lib
 from .lib import get_main_window, IS_HEADLESS
 from ..tools import show_look_assigner
 
@@ -32,15 +31,25 @@ from .workfile_template_builder import MayaTemplateBuilder
 log = logging.getLogger(__name__)
 
 MENU_NAME = "op_maya_menu"
+CONTEXT_ITEM = "{}|currentContext".format(MENU_NAME)
+
+# Whether the menu is currently installed and the last context label
+# applied to it, used by `update_menu_task_label`
+_MENU_INSTALLED = False
+_LAST_CONTEXT_LABEL = None
 
 
 def _get_menu(menu_name=None):
     """Return the menu instance if it currently exists in Maya"""
+    if IS_HEADLESS:
+        return None
+
     if menu_name is None:
         menu_name = MENU_NAME
 
-    widgets = {w.objectName(): w for w in QtWidgets.QApplication.allWidgets()}
-    return widgets.get(menu_name)
+    # Search below Maya's main window instead of enumerating every widget
+    # in the application.
+    return get_main_window().findChild(QtWidgets.QMenu, menu_name)
 
 
 def get_context_label():
@@ -50,12 +59,30 @@ def get_context_label():
     )
 
 
+def _set_render_settings(*args):
+    from ayon_maya.api import lib_rendersettings
+
+    lib_rendersettings.RenderSettings().set_default_renderer_settings()
+
+
+def _build_first_workfile(*args):
+    from ayon_core.pipeline.workfile import BuildWorkfile
+
+    BuildWorkfile().process()
+
+
 def install(project_settings):
     if cmds.about(batch=True):
         log.info("Skipping AYON menu initialization in batch mode..")
         return
 
     def add_menu():
+        global _MENU_INSTALLED, _LAST_CONTEXT_LABEL
+
+        # Remove a previously installed menu to avoid duplicates
+        if cmds.menu(MENU_NAME, exists=True):
+            cmds.deleteUI(MENU_NAME, menu=True)
+
         pyblish_icon = host_tools.get_pyblish_icon()
         parent_widget = get_main_window()
         cmds.menu(
@@ -66,12 +93,14 @@ def install(project_settings):
         )
 
         # Create context menu
+        _LAST_CONTEXT_LABEL = get_context_label()
         cmds.menuItem(
             "currentContext",
-            label=get_context_label(),
+            label=_LAST_CONTEXT_LABEL,
             parent=MENU_NAME,
             enable=False
         )
+        _MENU_INSTALLED = True
 
         cmds.setParent("..", menu=True)
 
@@ -154,14 +183,14 @@ def install(project_settings):
 
         cmds.menuItem(
             "Set Render Settings",
-            command=lambda *args: lib_rendersettings.RenderSettings().set_default_renderer_settings()    # noqa
+            command=_set_render_settings
         )
 
         cmds.menuItem(divider=True, parent=MENU_NAME)
         cmds.menuItem(
             "Build First Workfile",
             parent=MENU_NAME,
-            command=lambda *args: BuildWorkfile().process()
+            command=_build_first_workfile
         )
 
         cmds.menuItem(
@@ -178,42 +207,49 @@ def install(project_settings):
             )
         )
 
+        def build_template_menu(*args):
+            """Populate the Template Builder submenu on first open"""
+            host = registered_host()
+            cmds.menuItem(
+                "Build Workfile from template",
+                parent=builder_menu,
+                command=build_workfile_template
+            )
+            cmds.menuItem(
+                "Update Workfile from template",
+                parent=builder_menu,
+                command=update_workfile_template
+            )
+            cmds.menuItem(
+                divider=True,
+                parent=builder_menu
+            )
+            cmds.menuItem(
+                "Open Template",
+                parent=builder_menu,
+                command=lambda *args: open_template_ui(
+                    MayaTemplateBuilder(host), parent_widget
+                ),
+            )
+            cmds.menuItem(
+                "Create Placeholder",
+                parent=builder_menu,
+                command=create_placeholder
+            )
+            cmds.menuItem(
+                "Update Placeholder",
+                parent=builder_menu,
+                command=update_placeholder
+            )
+
+        # The submenu items are only built the first time it gets opened
         builder_menu = cmds.menuItem(
             "Template Builder",
             subMenu=True,
             tearOff=True,
-            parent=MENU_NAME
-        )
-        cmds.menuItem(
-            "Build Workfile from template",
-            parent=builder_menu,
-            command=build_workfile_template
-        )
-        cmds.menuItem(
-            "Update Workfile from template",
-            parent=builder_menu,
-            command=update_workfile_template
-        )
-        cmds.menuItem(
-            divider=True,
-            parent=builder_menu
-        )
-        cmds.menuItem(
-            "Open Template",
-            parent=builder_menu,
-            command=lambda *args: open_template_ui(
-                MayaTemplateBuilder(registered_host()), get_main_window()
-            ),
-        )
-        cmds.menuItem(
-            "Create Placeholder",
-            parent=builder_menu,
-            command=create_placeholder
-        )
-        cmds.menuItem(
-            "Update Placeholder",
-            parent=builder_menu,
-            command=update_placeholder
+            parent=MENU_NAME,
+            postMenuCommand=build_template_menu,
+            postMenuCommandOnce=True
         )
 
         cmds.setParent(MENU_NAME, menu=True)
@@ -265,13 +301,17 @@ def install(project_settings):
 
 
 def uninstall():
-    menu = _get_menu()
-    if menu:
+    global _MENU_INSTALLED
+
+    _MENU_INSTALLED = False
+    if IS_HEADLESS:
+        return
+
+    if cmds.menu(MENU_NAME, exists=True):
         log.info("Attempting to uninstall ...")
 
         try:
-            menu.deleteLater()
-            del menu
+            cmds.deleteUI(MENU_NAME, menu=True)
         except Exception as e:
             log.error(e)
 
@@ -279,21 +319,29 @@ def uninstall():
 def popup():
     """Pop-up the existing menu near the mouse cursor."""
     menu = _get_menu()
-    cursor = QtGui.QCursor()
-    point = cursor.pos()
-    menu.exec_(point)
+    menu.exec_(QtGui.QCursor.pos())
 
 
 def update_menu_task_label():
     """Update the task label in AYON menu to current session"""
+    global _MENU_INSTALLED, _LAST_CONTEXT_LABEL
 
     if IS_HEADLESS:
         return
 
-    object_name = "{}|currentContext".format(MENU_NAME)
-    if not cmds.menuItem(object_name, query=True, exists=True):
-        log.warning("Can't find menuItem: {}".format(object_name))
+    label = get_context_label()
+    if label == _LAST_CONTEXT_LABEL:
         return
 
-    label = get_context_label()
-    cmds.menuItem(object_name, edit=True, label=label)
+    if not _MENU_INSTALLED:
+        log.warning("Can't find menuItem: {}".format(CONTEXT_ITEM))
+        return
+
+    try:
+        cmds.menuItem(CONTEXT_ITEM, edit=True, label=label)
+    except RuntimeError:
+        # The menu was deleted without `uninstall`, e.g. by `deleteUI`
+        _MENU_INSTALLED = False
+        log.warning("Can't find menuItem: {}".format(CONTEXT_ITEM))
+        return
+    _LAST_CONTEXT_LABEL = label
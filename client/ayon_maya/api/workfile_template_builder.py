@@ -1,6 +1,7 @@
 import json
 
 from maya import cmds
+import maya.api.OpenMaya as om
 
 from ayon_core.pipeline import (
     registered_host,
@@ -22,6 +23,35 @@ from .lib import read, imprint, get_main_window
 
 PLACEHOLDER_SET = "PLACEHOLDERS_SET"
 
+# Maya attribute type `lib.imprint` creates for each serialized placeholder
+# value type, `bool` is listed before `int` since it is a subclass of it
+_ATTRIBUTE_TYPES = (
+    (bool, "bool"),
+    (str, "string"),
+    (int, "long"),
+    (float, "double"),
+)
+
+
+def _serialize_placeholder_value(value):
+    """Return placeholder value as it is stored on the placeholder node.
+
+    Complicated data that can't be represented as flat maya attributes is
+    written to json strings, e.g. multiselection EnumDef.
+
+    Returns:
+        tuple[Any, Optional[str]]: The serialized value and the type of
+            the attribute `lib.imprint` creates for it.
+
+    """
+    if isinstance(value, (list, tuple, dict)):
+        value = "JSON::{}".format(json.dumps(value, separators=(",", ":")))
+
+    for value_type, attribute_type in _ATTRIBUTE_TYPES:
+        if isinstance(value, value_type):
+            return value, attribute_type
+    return value, None
+
 
 class MayaTemplateBuilder(AbstractTemplateBuilder):
     """Concrete implementation of AbstractTemplateBuilder for maya"""
@@ -58,8 +88,13 @@ class MayaTemplateBuilder(AbstractTemplateBuilder):
         # make default cameras non-renderable
         default_cameras = [cam for cam in cmds.ls(cameras=True)
                            if cmds.camera(cam, query=True, startupCamera=True)]
+        sel = om.MSelectionList()
         for cam in default_cameras:
-            if not cmds.attributeQuery("renderable", node=cam, exists=True):
+            sel.add(cam)
+
+        for index, cam in enumerate(default_cameras):
+            fn = om.MFnDependencyNode(sel.getDependNode(index))
+            if not fn.hasAttribute("renderable"):
                 self.log.debug(
                     "Camera {} has no attribute 'renderable'".format(cam)
                 )
@@ -68,24 +103,31 @@ class MayaTemplateBuilder(AbstractTemplateBuilder):
 
         cmds.setAttr(PLACEHOLDER_SET + ".hiddenInOutliner", True)
 
-        imported_sets = cmds.ls(new_nodes, set=True)
-        if not imported_sets:
-            return True
-
         # update imported sets information
+        sel = om.MSelectionList()
+        for node in new_nodes or []:
+            try:
+                sel.add(node)
+            except RuntimeError:
+                # Node was removed or renamed during the import
+                continue
+
         folder_path = get_current_folder_path()
-        for node in imported_sets:
-            if not cmds.attributeQuery("id", node=node, exists=True):
+        iterator = om.MItSelectionList(sel, om.MFn.kSet)
+        while not iterator.isDone():
+            fn = om.MFnDependencyNode(iterator.getDependNode())
+            iterator.next()
+            if not fn.hasAttribute("id"):
                 continue
-            if cmds.getAttr("{}.id".format(node)) not in {
+            if fn.findPlug("id", False).asString() not in {
                 AYON_INSTANCE_ID, AVALON_INSTANCE_ID
             }:
                 continue
-            if not cmds.attributeQuery("folderPath", node=node, exists=True):
+            if not fn.hasAttribute("folderPath"):
                 continue
 
-            cmds.setAttr(
-                "{}.folderPath".format(node), folder_path, type="string")
+            cmds.setAttr("{}.folderPath".format(fn.name()), folder_path,
+                         type="string")
 
         return True
 
@@ -116,9 +158,17 @@ class MayaPlaceholderPlugin(PlaceholderPlugin):
             # Cache placeholder data to shared data
             nodes = cmds.ls("*.plugin_identifier", long=True, objectsOnly=True)
 
-            nodes_by_identifier = {}
+            # Read the identifiers through the API to avoid a `getAttr`
+            # command per placeholder node
+            sel = om.MSelectionList()
             for node in nodes:
-                identifier = cmds.getAttr("{}.plugin_identifier".format(node))
+                sel.add(node)
+
+            nodes_by_identifier = {}
+            for index, node in enumerate(nodes):
+                fn = om.MFnDependencyNode(sel.getDependNode(index))
+                identifier = fn.findPlug(
+                    "plugin_identifier", False).asString()
                 nodes_by_identifier.setdefault(identifier, []).append(node)
 
             # Set the cache
@@ -157,14 +207,28 @@ class MayaPlaceholderPlugin(PlaceholderPlugin):
             if value != placeholder_item.data.get(key):
                 changed_values[key] = value
 
-        # Delete attributes to ensure we imprint new data with correct type
-        for key in changed_values.keys():
-            placeholder_item.data[key] = value
-            if cmds.attributeQuery(key, node=node_name, exists=True):
-                attribute = "{}.{}".format(node_name, key)
+        placeholder_item.data.update(changed_values)
+
+        # Set values directly on attributes that already have the matching
+        # type, delete the others to ensure we imprint new data with the
+        # correct type
+        imprint_values = {}
+        for key, value in changed_values.items():
+            if not cmds.attributeQuery(key, node=node_name, exists=True):
+                imprint_values[key] = value
+                continue
+
+            attribute = "{}.{}".format(node_name, key)
+            value, attribute_type = _serialize_placeholder_value(value)
+            if cmds.getAttr(attribute, type=True) != attribute_type:
                 cmds.deleteAttr(attribute)
+                imprint_values[key] = value
+            elif attribute_type == "string":
+                cmds.setAttr(attribute, value, type="string")
+            else:
+                cmds.setAttr(attribute, value)
 
-        self.imprint(node_name, changed_values)
+        self.imprint(node_name, imprint_values)
 
     def collect_placeholders(self):
         placeholders = []
@@ -223,11 +287,8 @@ class MayaPlaceholderPlugin(PlaceholderPlugin):
     def imprint(self, node, data):
         """Imprint call for placeholder node"""
 
-        # Complicated data that can't be represented as flat maya attributes
-        # we write to json strings, e.g. multiselection EnumDef
         for key, value in data.items():
-            if isinstance(value, (list, tuple, dict)):
-                data[key] = "JSON::{}".format(json.dumps(value))
+            data[key], _ = _serialize_placeholder_value(value)
 
         imprint(node, data)
 
@@ -7,6 +7,19 @@ from ayon_core.lib import (
     NumberDef,
 )
 
+# Creator attributes which used to be stored on the instance but now are
+# publish attributes of the ExtractAlembic/ExtractAnimation plugins
+LEGACY_ALEMBIC_ATTRIBUTES = frozenset({
+    "attr",
+    "attrPrefix",
+    "visibleOnly",
+    "writeColorSets",
+    "writeFaceSets",
+    "writeNormals",
+    "renderableOnly",
+    "worldSpace",
+})
+
 
 def _get_animation_attr_defs(create_context):
     """Get Animation generic definitions."""
@@ -47,25 +60,12 @@ def convert_legacy_alembic_creator_attributes(node_data, class_name):
     if class_name in publish_attributes:
         return node_data
 
-    attributes = [
-        "attr",
-        "attrPrefix",
-        "visibleOnly",
-        "writeColorSets",
-        "writeFaceSets",
-        "writeNormals",
-        "renderableOnly",
-        "visibleOnly",
-        "worldSpace",
-        "renderableOnly"
-    ]
-    plugin_attributes = {}
-    for attr in attributes:
-        if attr not in node_data["creator_attributes"]:
-            continue
-        value = node_data["creator_attributes"].pop(attr)
-
-        plugin_attributes[attr] = value
+    creator_attributes = node_data["creator_attributes"]
+    plugin_attributes = {
+        attr: creator_attributes.pop(attr)
+        for attr in list(creator_attributes)
+        if attr in LEGACY_ALEMBIC_ATTRIBUTES
+    }
 
     publish_attributes[class_name] = plugin_attributes
 
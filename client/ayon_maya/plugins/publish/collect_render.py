@@ -105,7 +105,7 @@ class CollectMayaRender(plugin.MayaInstancePlugin):
             layer_render_products = get_layer_render_products(layer.name())
         except UnsupportedRendererException as exc:
             raise KnownPublishError(exc)
-        render_products = layer_render_products.layer_data.products
+        render_products = layer_render_products.products
         if not render_products:
             self.log.error(
                 "No render products generated for '%s'. You might not have "